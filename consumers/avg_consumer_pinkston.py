@@ -15,10 +15,15 @@ Example Kafka message format:
 
 # Import packages from Python Standard Library
 import os
-import json  # handle JSON parsing
+import sys
+import threading  # run the Kafka consumer off the main (GUI) thread
+from functools import lru_cache
 
 # Import external packages
 from dotenv import load_dotenv
+import msgspec  # handle JSON parsing with a schema-specific decoder
+import numpy as np
+import matplotlib
 
 # IMPORTANT
 # Import Matplotlib.pyplot for live plotting
@@ -31,7 +36,6 @@ from utils.utils_consumer import create_kafka_consumer
 from utils.utils_logger import logger
 from matplotlib.patches import Patch
 from matplotlib.lines import Line2D
-from statistics import mean
 
 #####################################
 # Load Environment Variables
@@ -44,28 +48,132 @@ load_dotenv()
 #####################################
 
 
+@lru_cache(maxsize=1)
 def get_kafka_topic() -> str:
-    """Fetch Kafka topic from environment or use default."""
-    topic = os.getenv("AVG_TOPIC", "unknown_topic")
-    logger.info(f"Kafka topic: {topic}")
-    return topic
+    """Fetch Kafka topic from environment or use default (read once, then cached)."""
+    return os.getenv("AVG_TOPIC", "unknown_topic")
 
 
+@lru_cache(maxsize=1)
 def get_kafka_consumer_group_id() -> str:
-    """Fetch Kafka consumer group id from environment or use default."""
-    group_id: str = os.getenv("AVG_CONSUMER_GROUP_ID", "default_group")
-    logger.info(f"Kafka consumer group id: {group_id}")
-    return group_id
+    """Fetch Kafka consumer group id from environment or use default (read once, then cached)."""
+    return os.getenv("AVG_CONSUMER_GROUP_ID", "default_group")
 
 
+def get_plot_enabled() -> bool:
+    """Return False if the live chart is turned off with NO_PLOT=1 or --no-plot."""
+    enabled = os.getenv("NO_PLOT") != "1" and "--no-plot" not in sys.argv[1:]
+    logger.info(f"Live chart enabled: {enabled}")
+    return enabled
+
+
+def get_matplotlib_backend() -> str:
+    """Fetch Matplotlib backend from environment or use a fast Agg-based default."""
+    default_backend = "TkAgg" if sys.platform == "win32" else "QtAgg"
+    backend: str = os.getenv("MPL_BACKEND", default_backend)
+    logger.info(f"Matplotlib backend: {backend}")
+    return backend
+
+
+#####################################
+# Message Schema
+#####################################
+
+
+class LifeExpectancyRecord(msgspec.Struct):
+    """One year of life expectancy data, as sent by the producer."""
+
+    year: int
+    total: float
+    female: float
+    male: float
+
+
+# Decoder specialized for this fixed schema, built once at import.
+# It parses and type-checks each message without building a dict.
+record_decoder = msgspec.json.Decoder(LifeExpectancyRecord)
+
+
+#####################################
+# Set up data structures (NumPy arrays)
 #####################################
-# Set up data structures (empty lists)
+
+# One fixed-size array per field, used as a ring buffer holding the
+# most recent PLOT_WINDOW records. Memory and per-frame work stay bounded
+# no matter how long the stream runs (the full 1900 - 2018 data fits
+# in the default window).
+PLOT_WINDOW = max(1, int(os.getenv("PLOT_WINDOW", "200")))
+
+years = np.empty(PLOT_WINDOW, dtype=np.int32)  # To store year for the x-axis
+total_ages = np.empty(PLOT_WINDOW, dtype=np.float64)  # To store age readings for the y-axis
+female_ages = np.empty(PLOT_WINDOW, dtype=np.float64)  # To store female age readings for the y-axis
+male_ages = np.empty(PLOT_WINDOW, dtype=np.float64)  # To store male age readings for the y-axis
+record_count = 0  # Number of records received so far (slot = record_count % PLOT_WINDOW)
+
+# Bar color for each record, decided once when the record arrives:
+# darkred where the total decreased from the previous year, steelblue otherwise
+colors = np.empty(PLOT_WINDOW, dtype="U9")
+last_total: float | None = None  # Total of the most recent record
+
+# Years whose records were overwritten since the last chart update,
+# so their bars can be removed (a set, so it stays small with no chart)
+evicted_years: set[int] = set()
+
+
+def append_record(year: int, total: float, female: float, male: float) -> None:
+    """Store one record in the ring buffer, overwriting the oldest when full."""
+    global record_count, last_total
+    with data_lock:
+        slot = record_count % PLOT_WINDOW
+        if record_count >= PLOT_WINDOW:
+            evicted_years.add(int(years[slot]))
+        years[slot] = year
+        total_ages[slot] = total
+        female_ages[slot] = female
+        male_ages[slot] = male
+        colors[slot] = "darkred" if last_total is not None and total < last_total else "steelblue"
+        last_total = total
+        record_count += 1
+
+
+def window_view(values: np.ndarray, count: int) -> np.ndarray:
+    """Return a copy of the buffered values in arrival order (oldest first)."""
+    if count <= PLOT_WINDOW:
+        return values[:count].copy()
+    split = count % PLOT_WINDOW
+    return np.concatenate((values[split:], values[:split]))
+
+
+#####################################
+# Thread Coordination
+#####################################
+
+# Kafka messages are consumed on a background thread while Matplotlib
+# runs on the main thread, so slow rendering never delays polling.
+data_lock = threading.Lock()  # Guards the data arrays and record_count
+chart_dirty = threading.Event()  # Set when new data is ready to be drawn
+stop_consuming = threading.Event()  # Set to ask the consumer thread to finish
+
+# How often the main thread checks for new data to draw
+RENDER_INTERVAL_MS = 200
+
+
 #####################################
+# Kafka Polling
+#####################################
+
+# Fetch messages in batches rather than one at a time
+POLL_TIMEOUT_MS = 500
+POLL_MAX_RECORDS = 500
 
-years = []  # To store year for the x-axis
-total_ages = []  # To store age readings for the y-axis
-female_ages = [] # To store female age readings for the y-axis
-male_ages = [] # To store male age readings for the y-axis
+
+#####################################
+# Chart Update Throttling
+#####################################
+
+# Redraw the chart only every Nth message (set DISP_SKIP=1 to draw every message)
+DISP_SKIP = max(1, int(os.getenv("DISP_SKIP", "5")))
+msg_counter = 0
 
 
 #########################################
@@ -73,73 +181,56 @@ male_ages = [] # To store male age readings for the y-axis
 #########################################
 
 DECADE_BLOCK = 10
-decade_data = []
 current_block_start = 1900
 
+# Running aggregates for the current block, updated as each record arrives
+block_count = 0
+block_sum_total = 0.0
+block_sum_female = 0.0
+block_sum_male = 0.0
+block_lowest = None  # Record with the lowest total so far
+block_highest = None  # Record with the highest total so far
+block_drops = []  # Years where the total dropped by more than 2 years
+block_prev_total = None
+
 
 #####################################
 # Set up live visuals
 #####################################
 
-# Use the subplots() method to create a tuple containing
-# two objects at once:
-# - a figure (which can have many axis)
-# - an axis (what they call a chart in Matplotlib)
-fig, ax = plt.subplots(figsize=(12, 6))
-fig.patch.set_facecolor('lightgray')
-ax.set_facecolor('lightgray')
-
-# Use the ion() method (stands for "interactive on")
-# to turn on interactive mode for live updates
-plt.ion()
-
+# Plotting can be turned off (NO_PLOT=1 or --no-plot), e.g. for
+# benchmarks or headless runs; then no figure is created at all.
+PLOT_ENABLED = get_plot_enabled()
 
-#####################################
-# Define an update chart function for live plotting
-# This will get called every time a new message is processed
-#####################################
+# Legend entries are constant, so build them once
+LEGEND_HANDLES = [
+    Patch(color="steelblue", label="Increase/No Change in Avg. Life Expectancy"),
+    Patch(color="darkred", label="Decrease in Avg. Life Expectancy"),
+    Line2D([0], [0], color="#8A2BE2", label="Female Avg. Life Expectancy", linewidth=2),
+    Line2D([0], [0], color="navy", label="Male Avg. Life Expectancy", linewidth=2)
+]
 
 
-def update_chart():
-    """
-    Update age vs. year chart.
-    
+def _init_axes() -> None:
     """
-    # Clear the previous chart
-    ax.clear()
-
-    # Create a bar chart using the plot() method
-    # Use the year for the x-axis and age for the y-axis
-    # Use the label parameter to add a legend entry
-    # Determine the bar color for each bar
-    colors = []
-    for i, age in enumerate(total_ages):
-        if i == 0:
-            colors.append("steelblue")
-        else:
-            if age < total_ages[i - 1]:
-                colors.append("darkred")
-            else:
-                colors.append("steelblue")
-
-    # Draw bars with conditional colors
-    ax.bar(years, total_ages, color=colors)
-
-    # Draw lines with gender-based colors
-    ax.plot(years, female_ages, color='#8A2BE2', label = 'Female Avg. Life Expectancy', linewidth=2)
-    ax.plot(years, male_ages, color='navy', label = 'Male Avg. Life Expectancy', linewidth=2)
+    Set up the parts of the chart that never change.
 
+    Labels, title, ticks, limits, grid, and legend are set once here
+    instead of on every message; they become part of the cached
+    background used for blitting.
+    """
     # Use the built-in axes methods to set the labels and title
     ax.set_xlabel("Year")
     ax.set_ylabel("Age")
     ax.set_title("Average U.S. Life Expectancy: 1900 - 2018 by James Pinkston")
 
+    # Set x-axis limits and ticks (fixed, since bars are added one at a time)
+    ax.set_xlim(1898, 2020)
+    ax.set_xticks(range(1900, 2025, 5))
+
     # Rotate x-axis label for readability
-    plt.xticks(rotation=45)
+    ax.tick_params(axis="x", labelrotation=45)
 
-    # Set x-axis ticks
-    ax.set_xticks(range(1900, 2025, 5))
-    
     # Set y-axis limits and ticks
     ax.set_ylim(30, 90)
     ax.set_yticks(range(30, 91, 5))
@@ -148,23 +239,145 @@ def update_chart():
     ax.grid(axis='y', linestyle='--', alpha=0.7)
 
     # Use the legend() method to display the legend
-    legend_handles = [
-        Patch(color="steelblue", label="Increase/No Change in Avg. Life Expectancy"),
-        Patch(color="darkred", label="Decrease in Avg. Life Expectancy"),
-        Line2D([0], [0], color="#8A2BE2", label="Female Avg. Life Expectancy", linewidth=2),
-        Line2D([0], [0], color="navy", label="Male Avg. Life Expectancy", linewidth=2)
-    ]
-
-    ax.legend(handles=legend_handles)
+    ax.legend(handles=LEGEND_HANDLES, loc="upper left")
 
     # Use the tight_layout() method to automatically adjust the padding
-    plt.tight_layout()
+    # (only once: the layout is static, so it never needs recomputing)
+    fig.tight_layout()
+
+
+# One zero-height bar per year (1900 - 2019) is created up front;
+# incoming records only change the height and color of their year's bar.
+YEARS_ALL = np.arange(1900, 2020)
+active_bars = {}  # Index into bar_patches -> bar, for years that have data
+bars_applied = 0  # Number of records already applied to the bars
+
+# Cached pixels of the static chart (axes, ticks, grid, legend)
+background = None
+
+
+def draw_animated_artists():
+    """Draw the bars and lines on top of the current canvas."""
+    for patch in active_bars.values():
+        ax.draw_artist(patch)
+    ax.draw_artist(line_f)
+    ax.draw_artist(line_m)
+
+
+def on_draw(event):
+    """
+    Re-cache the background after every full canvas draw (first show, resize).
+
+    """
+    global background
+    background = fig.canvas.copy_from_bbox(ax.bbox)
+    draw_animated_artists()
+
+
+if PLOT_ENABLED:
+    # Select an Agg-based backend before any figure exists
+    # (QtAgg by default; PyQt6 is not installed on Windows, so use TkAgg there)
+    matplotlib.use(get_matplotlib_backend())
+
+    # Simplify long paths aggressively and render them in chunks
+    matplotlib.rcParams.update({
+        "path.simplify": True,
+        "path.simplify_threshold": 1.0,
+        "agg.path.chunksize": 10000,
+        "figure.autolayout": False,
+    })
+
+    # Use the subplots() method to create a tuple containing
+    # two objects at once:
+    # - a figure (which can have many axis)
+    # - an axis (what they call a chart in Matplotlib)
+    fig, ax = plt.subplots(figsize=(12, 6))
+    fig.patch.set_facecolor('lightgray')
+    ax.set_facecolor('lightgray')
+
+    _init_axes()
+
+    # Create the data artists once and update them in place.
+    # animated=True keeps them out of full canvas draws so the
+    # background can be cached without them.
+    bar_container = ax.bar(YEARS_ALL, np.zeros(len(YEARS_ALL)), color="steelblue", animated=True)
+    bar_patches = bar_container.patches
+    line_f, = ax.plot([], [], color='#8A2BE2', linewidth=2, animated=True)
+    line_m, = ax.plot([], [], color='navy', linewidth=2, animated=True)
+
+    fig.canvas.mpl_connect("draw_event", on_draw)
+
+
+#####################################
+# Define an update chart function for live plotting
+# This will get called by a GUI timer whenever new data has arrived
+#####################################
 
-    # Draw the chart
-    plt.draw()
 
-    # Pause briefly to allow some time for the chart to render
-    plt.pause(0.01)  
+def update_chart():
+    """
+    Update age vs. year chart.
+
+    Restores the cached background and redraws only the bars and lines
+    (blitting) instead of clearing and rebuilding the whole chart.
+    """
+    global bars_applied
+
+    # Snapshot the buffered window in arrival order, holding the lock
+    # only for the copy so the consumer thread is never blocked by drawing
+    with data_lock:
+        n = record_count
+        year_data = window_view(years, n)
+        total_data = window_view(total_ages, n)
+        female_data = window_view(female_ages, n)
+        male_data = window_view(male_ages, n)
+        color_data = window_view(colors, n)
+        evicted = list(evicted_years)
+        evicted_years.clear()
+
+    # Remove bars for years that left the window (unless the year
+    # arrived again and is still in it), so bars and lines cover the same years
+    for year in evicted:
+        idx = year - YEARS_ALL[0]
+        if idx in active_bars and year not in year_data:
+            active_bars.pop(idx).set_height(0)
+
+    # Apply the records received since the last update to their bars,
+    # using the colors cached when each record arrived.
+    # Earlier bars never change, so only these new ones are touched.
+    new_count = min(n - bars_applied, len(year_data))
+    if new_count > 0:
+        new_records = zip(year_data[-new_count:], total_data[-new_count:], color_data[-new_count:])
+        for year, total, color in new_records:
+            idx = year - YEARS_ALL[0]
+            if 0 <= idx < len(bar_patches):
+                patch = bar_patches[idx]
+                patch.set_height(total)
+                patch.set_facecolor(color)
+                active_bars[idx] = patch
+        bars_applied = n
+
+    # Update lines with gender-based data
+    line_f.set_data(year_data, female_data)
+    line_m.set_data(year_data, male_data)
+
+    # Restore the static background and draw only the changed artists
+    if background is None:
+        fig.canvas.draw()
+    else:
+        fig.canvas.restore_region(background)
+        draw_animated_artists()
+
+    # Copy the updated axes area to the screen
+    # (the running GUI event loop repaints it; no flush or pause needed)
+    fig.canvas.blit(ax.bbox)
+
+
+def render_if_dirty() -> None:
+    """Redraw the chart if the consumer thread has stored new data."""
+    if chart_dirty.is_set():
+        chart_dirty.clear()
+        update_chart()
 
 
 #######################################
@@ -172,26 +385,48 @@ def update_chart():
 #######################################
 
 
-def periodic_report(block, start_year, end_year):
+def update_decade_block(record: LifeExpectancyRecord) -> None:
     """
-    Prints analytics for one full decade block.
+    Add one record to the running aggregates of the current decade block.
     """
-    totals = [d['total'] for d in block]
-    females = [d['female'] for d in block]
-    males = [d['male'] for d in block]
+    global block_count, block_sum_total, block_sum_female, block_sum_male
+    global block_lowest, block_highest, block_prev_total
 
-    avg_total = mean(totals)
-    avg_female = mean(females)
-    avg_male = mean(males)
-    gender_gap = avg_female - avg_male
+    block_count += 1
+    block_sum_total += record.total
+    block_sum_female += record.female
+    block_sum_male += record.male
+
+    if block_lowest is None or record.total < block_lowest.total:
+        block_lowest = record
+    if block_highest is None or record.total > block_highest.total:
+        block_highest = record
+
+    if block_prev_total is not None and block_prev_total - record.total > 2:
+        block_drops.append(record.year)
+    block_prev_total = record.total
 
-    lowest = min(block, key=lambda d: d['total'])
-    highest = max(block, key=lambda d: d['total'])
 
-    drops = []
-    for prev, curr in zip(block, block[1:]):
-        if prev['total'] - curr['total'] > 2:
-            drops.append(curr['year'])
+def reset_decade_block() -> None:
+    """
+    Clear the running aggregates before the next decade block.
+    """
+    global block_count, block_sum_total, block_sum_female, block_sum_male
+    global block_lowest, block_highest, block_prev_total
+
+    block_count = 0
+    block_sum_total = block_sum_female = block_sum_male = 0.0
+    block_lowest = block_highest = None
+    block_drops.clear()
+    block_prev_total = None
+
+
+def periodic_report(start_year, end_year, avg_total, avg_female, avg_male,
+                    lowest, highest, drops):
+    """
+    Prints analytics for one full decade block.
+    """
+    gender_gap = avg_female - avg_male
 
     RED = "\033[91m"
     RESET = "\033[0m"
@@ -202,15 +437,15 @@ def periodic_report(block, start_year, end_year):
     print("-" * 50)
     print(f"Avg. Life Expectancy: Total = {avg_total:.1f}, "
           f"Female = {avg_female:.1f}, Male = {avg_male:.1f}")
-    print(f"Lowest Life Expectancy: {lowest['year']} "
-          f"(Total = {lowest['total']:.1f}, "
-          f"Female = {lowest['female']:.1f}, "
-          f"Male = {lowest['male']:.1f})"
-          f"{RED + '⚠️' + RESET if lowest['year'] in drops else ''}")
-    print(f"Highest Life Expectancy: {highest['year']} "
-          f"(Total = {highest['total']:.1f}, "
-          f"Female = {highest['female']:.1f}, "
-          f"Male = {highest['male']:.1f})")
+    print(f"Lowest Life Expectancy: {lowest.year} "
+          f"(Total = {lowest.total:.1f}, "
+          f"Female = {lowest.female:.1f}, "
+          f"Male = {lowest.male:.1f})"
+          f"{RED + '⚠️' + RESET if lowest.year in drops else ''}")
+    print(f"Highest Life Expectancy: {highest.year} "
+          f"(Total = {highest.total:.1f}, "
+          f"Female = {highest.female:.1f}, "
+          f"Male = {highest.male:.1f})")
     print(f"Gender Gap (Avg.): {gender_gap:.1f} years")
 
     if drops:
@@ -225,65 +460,99 @@ def periodic_report(block, start_year, end_year):
 # #####################################
 
 
-def process_message(message: str) -> None:
-    global decade_data, current_block_start
+def process_message(message: bytes) -> None:
+    global current_block_start, msg_counter
     """
     Process a JSON-transferred CSV message.
 
     Args:
-        message (str): JSON message received from Kafka.
+        message (bytes): Raw JSON message received from Kafka.
         
     """
     try:
         # Log the raw message for debugging
-        logger.debug(f"Raw message: {message}")
-
-        # Parse the JSON string into a Python dictionary
-        data: dict = json.loads(message)
-        year = data.get("year")
-        total = data.get("total")
-        female = data.get("female")
-        male = data.get("male")
-        
-        logger.info(f"Processed JSON message: {data}")
-
-        # Ensure the required fields are present
-        if total is None or year is None or female is None or male is None:
-            logger.error(f"Invalid message format: {message}")
-            return
-
-        # Append the year and ages to the chart based on gender
-        years.append(year)
-        total_ages.append(total)
-        female_ages.append(female)
-        male_ages.append(male)
+        # (pass values as arguments so loguru only formats them when the level is enabled)
+        logger.debug("Raw message: {}", message)
+
+        # Parse the JSON message into a typed record
+        # (missing or mistyped fields raise msgspec.ValidationError)
+        record = record_decoder.decode(message)
+        year, total, female, male = record.year, record.total, record.female, record.male
+
+        logger.info("Processed JSON message: {}", record)
+
+        # Store the year and ages for the chart based on gender
+        append_record(year, total, female, male)
         
-        # Update chart after processing this message
-        update_chart()
+        # Count messages so main() can throttle chart updates
+        msg_counter += 1
 
         # Decade report tracking
-        decade_data.append({
-            'year': year,
-            'total': total,
-            'female': female,
-            'male': male
-        })
+        update_decade_block(record)
 
         # If we've reached the end of a decade (e.g., 1910, 1920, 1930...)
         if (year - current_block_start) == DECADE_BLOCK:
             # Print the report for this finished decade
-            periodic_report(decade_data, current_block_start, year - 1)
+            periodic_report(
+                current_block_start,
+                year - 1,
+                block_sum_total / block_count,
+                block_sum_female / block_count,
+                block_sum_male / block_count,
+                block_lowest,
+                block_highest,
+                block_drops,
+            )
 
             # Reset for the next decade block
-            decade_data.clear()
+            reset_decade_block()
             current_block_start = year
             
-    except json.JSONDecodeError as e:
+    except msgspec.ValidationError as e:
+        logger.error(f"Invalid message format: {message} ({e})")
+    except msgspec.DecodeError as e:
         logger.error(f"JSON decoding error for message '{message}': {e}")
     except Exception as e:
         logger.error(f"Error processing message '{message}': {e}")
 
 
+#####################################
+# Consumer thread
+#####################################
+
+
+def consume_loop(consumer) -> None:
+    """
+    Poll Kafka in batches and store the data until asked to stop.
+
+    Runs on a background thread. It never draws; it only marks the chart
+    dirty so the main thread can redraw on its next timer tick.
+    """
+    last_update_count = 0
+    try:
+        while not stop_consuming.is_set():
+            batch = consumer.poll(timeout_ms=POLL_TIMEOUT_MS, max_records=POLL_MAX_RECORDS)
+            if not batch:
+                # Stream is idle: draw any messages skipped by DISP_SKIP
+                if msg_counter > last_update_count:
+                    chart_dirty.set()
+                    last_update_count = msg_counter
+                continue
+
+            for records in batch.values():
+                for message in records:
+                    message_bytes = message.value
+                    logger.debug("Received message at offset {}: {}", message.offset, message_bytes)
+                    process_message(message_bytes)
+
+            # Request a chart update after every DISP_SKIP messages
+            if msg_counter - last_update_count >= DISP_SKIP:
+                chart_dirty.set()
+                last_update_count = msg_counter
+    except Exception as e:
+        logger.error(f"Error while consuming messages: {e}")
+
+
 #####################################
 # Define main function for this module
 #####################################
@@ -295,15 +564,17 @@ def main() -> None:
 
     - Reads the Kafka topic name and consumer group ID from environment variables.
     - Creates a Kafka consumer using the `create_kafka_consumer` utility.
-    - Polls messages and updates a live chart.
+    - Polls messages in batches on a background thread.
+    - Updates a live chart from a timer on the main thread until the window is closed.
+    - With plotting turned off, polls on the main thread instead and draws nothing.
     """
+    global record_count, last_total
     logger.info("START consumer.")
 
     # Clear previous run's data
-    years.clear()
-    total_ages.clear()
-    female_ages.clear()
-    male_ages.clear()
+    record_count = 0
+    last_total = None
+    evicted_years.clear()
     
     # fetch .env content
     topic = get_kafka_topic()
@@ -311,23 +582,41 @@ def main() -> None:
     logger.info(f"Consumer: Topic '{topic}' and group '{group_id}'...")
     
     # Create the Kafka consumer using the helpful utility function.
-    consumer = create_kafka_consumer(topic, group_id)
+    # Keep message values as raw bytes: the JSON decoder reads bytes directly,
+    # so there is no need to decode each one to a str first.
+    consumer = create_kafka_consumer(
+        topic, group_id, value_deserializer_provided=lambda x: x
+    )
 
-    # Poll and process messages
     logger.info(f"Polling messages from topic '{topic}'...")
+    consumer_thread = None
+    timer = None
     try:
-        for message in consumer:
-            message_str = message.value
-            logger.debug(f"Received message at offset {message.offset}: {message_str}")
-            process_message(message_str)
+        if PLOT_ENABLED:
+            # Poll and process messages on a background thread
+            consumer_thread = threading.Thread(target=consume_loop, args=(consumer,), daemon=True)
+            consumer_thread.start()
+
+            # Redraw from the GUI event loop whenever new data has arrived
+            timer = fig.canvas.new_timer(interval=RENDER_INTERVAL_MS)
+            timer.add_callback(render_if_dirty)
+            timer.start()
+
+            # Blocks until the chart window is closed
+            plt.show(block=True)
+        else:
+            # No chart: poll and process messages right here
+            consume_loop(consumer)
     except KeyboardInterrupt:
         logger.warning("Consumer interrupted by user.")
-    except Exception as e:
-        logger.error(f"Error while consuming messages: {e}")
     finally:
+        if timer is not None:
+            timer.stop()
+        stop_consuming.set()
+        if consumer_thread is not None:
+            consumer_thread.join()
         consumer.close()
         logger.info(f"Kafka consumer for topic '{topic}' closed.")
-        
 
 
 #####################################
@@ -337,5 +626,3 @@ def main() -> None:
 # Ensures this script runs only when executed directly (not when imported as a module).
 if __name__ == "__main__":
     main()
-    plt.ioff()  # Turn off interactive mode after completion
-    plt.show()
\ No newline at end of file
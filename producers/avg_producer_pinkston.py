@@ -16,12 +16,11 @@ import os
 import sys
 import time  # control message intervals
 import pathlib  # work with file paths
-import csv  # handle CSV data
-import json  # work with JSON data
 from datetime import datetime  # work with timestamps
 
 # Import external packages
 from dotenv import load_dotenv
+import numpy as np  # parse the CSV data
 
 # Import functions from local modules
 from utils.utils_producer import (
@@ -37,23 +36,34 @@ from utils.utils_logger import logger
 
 load_dotenv()
 
+#####################################
+# Settings from .env Variables
+#####################################
+
+# Read once at import; the getters below just return these values
+KAFKA_TOPIC: str = os.getenv("AVG_TOPIC", "unknown_topic")
+INTERVAL_SECS: float = float(os.getenv("AVG_INTERVAL_SECONDS", 1))  # fractions allowed; 0 = no pacing
+BATCH_SIZE: int = max(1, int(os.getenv("BATCH_SIZE", 100)))
+
+
 #####################################
 # Getter Functions for .env Variables
 #####################################
 
 
 def get_kafka_topic() -> str:
-    """Fetch Kafka topic from environment or use default."""
-    topic = os.getenv("AVG_TOPIC", "unknown_topic")
-    logger.info(f"Kafka topic: {topic}")
-    return topic
+    """Return the Kafka topic (from environment or default)."""
+    return KAFKA_TOPIC
+
+
+def get_message_interval() -> float:
+    """Return the message interval in seconds (from environment or default)."""
+    return INTERVAL_SECS
 
 
-def get_message_interval() -> int:
-    """Fetch message interval from environment or use default."""
-    interval = int(os.getenv("AVG_INTERVAL_SECONDS", 1))
-    logger.info(f"Message interval: {interval} seconds")
-    return interval
+def get_batch_size() -> int:
+    """Return the number of messages sent between producer flushes (from environment or default)."""
+    return BATCH_SIZE
 
 
 #####################################
@@ -70,62 +80,66 @@ DATA_FOLDER = PROJECT_ROOT.joinpath("data")
 logger.info(f"Data folder: {DATA_FOLDER}")
 
 # Set the name of the data file
-DATA_FILE = DATA_FOLDER.joinpath("avg_le.csv")
-FEMALE_FILE = DATA_FOLDER.joinpath("female_le.csv")
-MALE_FILE = DATA_FOLDER.joinpath("male_le.csv")
-logger.info(f"Total Average Data file: {DATA_FILE}")
-logger.info(f"Female Data file: {FEMALE_FILE}")
-logger.info(f"Male Data file: {MALE_FILE}")
+# (avg_le.csv, female_le.csv, and male_le.csv joined on year ahead of time
+# by scripts/build_joined_csv.py)
+DATA_FILE = DATA_FOLDER.joinpath("avg_joined.csv")
+logger.info(f"Joined Data file: {DATA_FILE}")
+
+#####################################
+# Progress Logging
+#####################################
+
+# Log a progress line at INFO every N messages (per-message lines are DEBUG)
+PROGRESS_LOG_INTERVAL = 100
+
+# Seconds to wait for queued messages on shutdown, so an unreachable
+# broker cannot hang the exit (e.g. after Ctrl+C)
+FINAL_FLUSH_TIMEOUT_SECS = 10
+
 
 #####################################
 # Message Generator
 #####################################
 
+# Columns the joined data file must provide
+REQUIRED_COLUMNS = {"year", "total", "female", "male"}
+
+# Every message has the same four fields, so build the JSON bytes from a
+# fixed template (%a formats each age with repr(), e.g. 47.3 or 52.0,
+# so the bytes match what json.dumps produced for the same record)
+MESSAGE_TEMPLATE = b'{"year":%d,"total":%a,"female":%a,"male":%a}'
+
 
 def generate_messages():
     """
-    Read from three csv files and yield records one by one, until the file is read.
+    Read the joined csv file and yield records one by one.
 
-    Args:
-        total_file (pathlib.Path): Path to avg_le.csv
-        female_file (pathlib.Path): Path to female_le.csv
-        male_file (pathlib.Path): Path to male_le.csv
+    All parsing happens up front: the file is parsed in a single pass by
+    NumPy's C parser (np.loadtxt) and its columns are kept as NumPy arrays.
+    The loop that yields messages only formats values into MESSAGE_TEMPLATE.
+    Records are read from DATA_FILE (avg_joined.csv).
 
     Yields:
-        dict: JSON-ready message with year, total, female, and male ages.
+        bytes: JSON-encoded message with year, total, female, and male ages.
     """
     try:
-        logger.info(f"Opening total data file: {DATA_FILE}")
-        logger.info(f"Opening female date file: {FEMALE_FILE}")
-        logger.info(f"Opening male data file: {MALE_FILE}")
-
-        with open(DATA_FILE, "r") as t_file, \
-            open(FEMALE_FILE, "r") as f_file, \
-            open(MALE_FILE, "r") as m_file:
-        
-            total_reader = csv.DictReader(t_file)
-            female_reader = csv.DictReader(f_file)
-            male_reader = csv.DictReader(m_file)
-
-            for total_row, female_row, male_row in zip(total_reader, female_reader, male_reader):
-                if "year" not in total_row or "age" not in total_row:
-                    logger.error(f"Missing 'year' or 'age' in total row: {total_row}")
-                    continue
-                if "year" not in female_row or "age" not in female_row:
-                    logger.error(f"Missing 'year' or 'age' in female row: {female_row}")
-                    continue
-                if "year" not in male_row or "age" not in male_row:
-                    logger.error(f"Missing 'year' or 'age' in male row: {male_row}")
-                    continue
-
-                yield {
-                    "year": int(total_row["year"]),
-                    "total": float(total_row["age"]),
-                    "female": float(female_row["age"]),
-                    "male": float(male_row["age"])
-                }
-                    
-        
+        logger.info(f"Opening joined data file: {DATA_FILE}")
+        with open(DATA_FILE, "r") as data_file:
+            # Validate the header once instead of checking every row
+            header = data_file.readline().strip().split(",")
+            missing = REQUIRED_COLUMNS - set(header)
+            if missing:
+                logger.error(f"Missing column(s) {sorted(missing)} in {DATA_FILE}. Exiting.")
+                sys.exit(1)
+
+            # Parse all remaining rows in one call
+            data = np.loadtxt(data_file, delimiter=",", ndmin=2)
+
+        years = data[:, header.index("year")].astype(np.int64)
+        totals = data[:, header.index("total")]
+        females = data[:, header.index("female")]
+        males = data[:, header.index("male")]
+
     except FileNotFoundError as e:
         logger.error(f"File not found: {e.filename}. Exiting.")
         sys.exit(1)
@@ -133,6 +147,31 @@ def generate_messages():
         logger.error(f"Unexpected error in message generation: {e}")
         sys.exit(3)
 
+    # Convert each column to Python numbers once (in C), then fill the
+    # fixed message template: no dict and no JSON encoder per message
+    records = zip(years.tolist(), totals.tolist(), females.tolist(), males.tolist())
+    for record in records:
+        yield MESSAGE_TEMPLATE % record
+
+#####################################
+# Delivery Reports
+#####################################
+
+
+def delivery_report(err, msg) -> None:
+    """
+    Log the outcome of each produced message.
+
+    Called by the producer from poll() or flush() once a message is
+    delivered or has permanently failed, so the send loop itself does
+    no per-message logging.
+    """
+    if err is not None:
+        logger.error(f"Delivery failed for message to topic '{msg.topic()}': {err}")
+    else:
+        logger.debug("Delivered message to topic '{}' at offset {}: {}", msg.topic(), msg.offset(), msg.value())
+
+
 #####################################
 # Define main function for this module.
 #####################################
@@ -153,18 +192,23 @@ def main():
     # fetch .env content
     topic = get_kafka_topic()
     interval_secs = get_message_interval()
-
-    # Verify the data files exists
-    for file_path in [DATA_FILE, FEMALE_FILE, MALE_FILE]:
-        if not file_path.exists():
-            logger.error(f"Data file not found: {file_path}. Exiting.")
-            sys.exit(1)
+    batch_size = get_batch_size()
+    logger.info(f"Kafka topic: {topic}")
+    logger.info(f"Message interval: {interval_secs} seconds")
+    logger.info(f"Flush batch size: {batch_size} messages")
+
+    # Verify the data file exists
+    if not DATA_FILE.exists():
+        logger.error(
+            f"Data file not found: {DATA_FILE}. "
+            "Run 'python -m scripts.build_joined_csv' to create it. Exiting."
+        )
+        sys.exit(1)
 
     # Create the Kafka producer
-    producer = create_kafka_producer(
-        value_serializer=lambda x: json.dumps(x).encode("utf-8")
-    )
-    if not producer:
+    # (generate_messages already yields JSON bytes, so no serializer is needed)
+    producer = create_kafka_producer()
+    if producer is None:  # not "if not producer": len(producer) is its queue length
         logger.error("Failed to create Kafka producer. Exiting...")
         sys.exit(3)
 
@@ -178,18 +222,56 @@ def main():
 
     # Generate and send messages
     logger.info(f"Starting message production to topic '{topic}'...")
+    sent_count = 0
     try:
-        for csv_message in generate_messages():
-            producer.send(topic, value=csv_message)
-            logger.info(f"Sent message to topic '{topic}': {csv_message}")
-            time.sleep(interval_secs)
+        # Pace against a fixed schedule (monotonic deadline) so the time
+        # spent sending does not add to each interval and drift accumulates
+        next_send_time = time.monotonic()
+
+        # Look up the producer methods once, outside the loop
+        produce = producer.produce
+        poll = producer.poll
+
+        for sent_count, csv_message in enumerate(generate_messages(), start=1):
+            # Enqueue only; librdkafka sends in the background.
+            # If its local queue is full, serve deliveries until there is room.
+            while True:
+                try:
+                    produce(topic, csv_message, callback=delivery_report)
+                    break
+                except BufferError:
+                    poll(0.1)
+
+            # Per-message detail is logged at DEBUG by delivery_report;
+            # a periodic count at INFO shows progress
+            if sent_count % PROGRESS_LOG_INTERVAL == 0:
+                logger.info(f"Sent {sent_count} messages to topic '{topic}'.")
+
+            # Serve delivery callbacks without blocking
+            poll(0)
+
+            # Flush on batch boundaries; between flushes the producer
+            # batches messages itself (see linger/batch settings in utils_producer)
+            if sent_count % batch_size == 0:
+                producer.flush()
+
+            # With no interval, send as fast as possible (skip even sleep(0))
+            if interval_secs > 0:
+                next_send_time += interval_secs
+                delay = next_send_time - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
     except KeyboardInterrupt:
         logger.warning("Producer interrupted by user.")
     except Exception as e:
         logger.error(f"Error during message production: {e}")
     finally:
-        producer.close()
-        logger.info("Kafka producer closed.")
+        # Deliver anything still queued before exiting
+        remaining = producer.flush(FINAL_FLUSH_TIMEOUT_SECS)
+        logger.info(f"Sent {sent_count} messages to topic '{topic}' in total.")
+        if remaining:
+            logger.warning(f"{remaining} message(s) were not delivered before the flush timed out.")
+        logger.info("Kafka producer flushed.")
 
     logger.info("END producer.")
 
@@ -0,0 +1,98 @@
+"""
+build_joined_csv.py
+
+Join the three life expectancy csv files into a single file
+that the producer can stream without any per-run merging.
+
+Input files (each with columns year,age):
+    data/avg_le.csv, data/female_le.csv, data/male_le.csv
+
+Output file (columns year,total,female,male):
+    data/avg_joined.csv
+
+Run from the project root after changing any of the input files:
+    python -m scripts.build_joined_csv
+"""
+
+#####################################
+# Import Modules
+#####################################
+
+# Import packages from Python Standard Library
+import pathlib  # work with file paths
+import sys
+
+# Import external packages
+import pandas as pd  # parse and join the CSV data
+
+# Import functions from local modules
+from utils.utils_logger import logger
+
+#####################################
+# Set up Paths
+#####################################
+
+# The parent directory of this file is its folder.
+# Go up one more parent level to get the project root.
+PROJECT_ROOT = pathlib.Path(__file__).parent.parent
+DATA_FOLDER = PROJECT_ROOT.joinpath("data")
+
+# Source files, keyed by the column name each age gets in the joined file
+SOURCE_FILES = {
+    "total": DATA_FOLDER.joinpath("avg_le.csv"),
+    "female": DATA_FOLDER.joinpath("female_le.csv"),
+    "male": DATA_FOLDER.joinpath("male_le.csv"),
+}
+JOINED_FILE = DATA_FOLDER.joinpath("avg_joined.csv")
+
+# Columns every source file must provide
+REQUIRED_COLUMNS = {"year", "age"}
+
+
+#####################################
+# Helper Functions
+#####################################
+
+
+def read_age_file(file_path: pathlib.Path, age_column: str) -> pd.DataFrame:
+    """
+    Read one year/age csv file, validating its header once.
+
+    Args:
+        file_path (pathlib.Path): Path to the csv file.
+        age_column (str): Name to give the age column (e.g. "female").
+
+    Returns:
+        pd.DataFrame: Frame with columns year and age_column.
+    """
+    df = pd.read_csv(file_path)
+    missing = REQUIRED_COLUMNS - set(df.columns)
+    if missing:
+        logger.error(f"Missing column(s) {sorted(missing)} in {file_path}. Exiting.")
+        sys.exit(1)
+    return df[["year", "age"]].rename(columns={"age": age_column})
+
+
+def build_joined_csv() -> None:
+    """Join the source files on year and write the combined csv file."""
+    try:
+        frames = [read_age_file(path, column) for column, path in SOURCE_FILES.items()]
+    except FileNotFoundError as e:
+        logger.error(f"File not found: {e.filename}. Exiting.")
+        sys.exit(1)
+
+    # Keep only years present in all three files
+    joined_df = frames[0]
+    for df in frames[1:]:
+        joined_df = joined_df.merge(df, on="year")
+
+    joined_df.to_csv(JOINED_FILE, index=False)
+    logger.info(f"Wrote {len(joined_df)} rows to {JOINED_FILE}")
+
+
+#####################################
+# Conditional Execution
+#####################################
+
+if __name__ == "__main__":
+    build_joined_csv()
@@ -2,6 +2,8 @@
 utils_producer.py - common functions used by producers.
 
 Producers send messages to a Kafka topic.
+The producer itself uses confluent-kafka (librdkafka, a C client);
+readiness checks and topic management use kafka-python's admin client.
 """
 
 #####################################
@@ -12,11 +14,13 @@ Producers send messages to a Kafka topic.
 import os
 import sys
 import time
-from typing import Callable, Optional, Any
+from functools import lru_cache
+from typing import Optional
 
 # Import external packages
 from dotenv import load_dotenv
-from kafka import KafkaProducer, errors
+from confluent_kafka import Producer
+from kafka import errors
 from kafka.admin import (
     KafkaAdminClient,
     NewTopic,
@@ -32,13 +36,31 @@ from utils.utils_logger import logger
 
 DEFAULT_KAFKA_BROKER_ADDRESS = "localhost:9092"
 
+# Let the producer group messages into larger requests:
+# wait up to DEFAULT_LINGER_MS for a batch to fill, up to DEFAULT_BATCH_SIZE_BYTES
+DEFAULT_LINGER_MS = 100
+DEFAULT_BATCH_SIZE_BYTES = 65536
+
+# Maximum number of messages buffered in the producer's local queue
+DEFAULT_QUEUE_MAX_MESSAGES = 1000000
+
+# Compress each batch before sending; JSON records with repeated keys
+# compress well, and lz4 is fast enough not to slow the producer
+DEFAULT_COMPRESSION_TYPE = "lz4"
+
 #####################################
 # Helper Functions
 #####################################
 
 
+@lru_cache(maxsize=1)
 def get_kafka_broker_address():
-    """Fetch Kafka broker address from environment or use default."""
+    """
+    Fetch Kafka broker address from environment or use default.
+
+    Cached, so the environment is read and the address logged only once
+    even though every Kafka helper below calls this.
+    """
     broker_address = os.getenv("KAFKA_BROKER_ADDRESS", "localhost:9092")
     logger.info(f"Kafka broker address: {broker_address}")
     return broker_address
@@ -82,33 +104,29 @@ def verify_services():
         sys.exit(2)
 
 
-def create_kafka_producer(
-    value_serializer: Optional[Callable[[Any], bytes]] = None,
-) -> Optional[KafkaProducer]:
+def create_kafka_producer() -> Optional[Producer]:
     """
     Create and return a Kafka producer instance.
 
-    Args:
-        value_serializer (callable): A custom serializer for message values.
-                                     Defaults to UTF-8 string encoding.
+    The producer is confluent-kafka's Producer: sending, batching, and
+    delivery run on librdkafka's background C threads. Values passed to
+    produce() must already be bytes (or str).
 
     Returns:
-        KafkaProducer: Configured Kafka producer instance.
+        Producer: Configured Kafka producer instance.
     """
     kafka_broker = get_kafka_broker_address()
 
-    if value_serializer is None:
-
-        def default_value_serializer(x: str) -> bytes:
-            return x.encode("utf-8")  # Default to string serialization
-
-        value_serializer = default_value_serializer
-
     try:
         logger.info(f"Connecting to Kafka broker at {kafka_broker}...")
-        producer = KafkaProducer(
-            bootstrap_servers=kafka_broker,
-            value_serializer=value_serializer,
+        producer = Producer(
+            {
+                "bootstrap.servers": kafka_broker,
+                "linger.ms": DEFAULT_LINGER_MS,
+                "batch.size": DEFAULT_BATCH_SIZE_BYTES,
+                "queue.buffering.max.messages": DEFAULT_QUEUE_MAX_MESSAGES,
+                "compression.type": DEFAULT_COMPRESSION_TYPE,
+            }
         )
         logger.info("Kafka producer successfully created.")
         return producer